@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import argparse
-from copy import deepcopy
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from app.config import load_config
 from app.pipeline import ReceiptExtractionPipeline
 from io_utils.batch_progress import (
     is_already_processed,
-    load_processed_registry,
+    load_result_payloads,
+    read_processed_registry,
     save_processed_registry,
     update_processed_registry,
     write_summary_csv,
@@ -17,7 +17,7 @@ from io_utils.batch_progress import (
 from io_utils.image_loader import list_images
 from io_utils.json_writer import load_json, write_json
 from notifications.service import NotificationService
-from ocr.factory import create_ocr_adapter
+from ocr.factory import canonical_engine_name, create_ocr_adapter
 from resolver.year_consistency import apply_year_consistency
 from templates.learner import TemplateLearner
 from templates.store import TemplateStore
@@ -70,13 +70,6 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _canonical_engine_name(name: str) -> str:
-    lowered = name.strip().lower()
-    if lowered in {"deepseek-ocr", "deepseek_ocr"}:
-        return "deepseek"
-    return lowered
-
-
 def _apply_force_cpu_config(
     config: dict[str, Any],
     force_cpu: bool,
@@ -85,15 +78,14 @@ def _apply_force_cpu_config(
     if not force_cpu:
         return config
     if target_engines is not None:
-        normalized = {_canonical_engine_name(str(engine)) for engine in target_engines if str(engine).strip()}
+        normalized = {canonical_engine_name(str(engine)) for engine in target_engines if str(engine).strip()}
         if "yomitoku" not in normalized:
             return config
 
-    updated = deepcopy(config)
-    ocr_conf = updated.setdefault("ocr", {})
-    engines_conf = ocr_conf.setdefault("engines", {})
-    yomitoku_conf = engines_conf.setdefault("yomitoku", {})
-    yomitoku_conf["device"] = "cpu"
+    updated = dict(config)
+    ocr_conf = updated["ocr"] = dict(config.get("ocr", {}))
+    engines_conf = ocr_conf["engines"] = dict(ocr_conf.get("engines", {}))
+    engines_conf["yomitoku"] = {**engines_conf.get("yomitoku", {}), "device": "cpu"}
     return updated
 
 
@@ -146,13 +138,14 @@ def cmd_batch(args: argparse.Namespace, config: dict[str, Any]) -> int:
     output_dir = target_dir
     output_dir.mkdir(parents=True, exist_ok=True)
     processed_registry_path = output_dir / "processed_files.json"
-    processed_registry = load_processed_registry(processed_registry_path)
+    processed_registry, registry_is_current = read_processed_registry(processed_registry_path)
 
     summary: list[dict[str, Any]] = []
     failed = 0
     skipped = 0
     succeeded: list[tuple[Path, Any]] = []
     unprocessed_images: list[Path] = []
+    written_payloads: dict[str, dict[str, Any]] = {}
 
     for image in images:
         if is_already_processed(processed_registry, image):
@@ -188,13 +181,16 @@ def cmd_batch(args: argparse.Namespace, config: dict[str, Any]) -> int:
 
     if succeeded:
         apply_year_consistency([result for _, result in succeeded], runtime_config)
+        pretty = bool(runtime_config.get("output", {}).get("pretty_json", True))
         for image, result in succeeded:
             output_path = output_dir / f"{image.stem}.result.json"
+            payload = result.to_dict()
             write_json(
                 output_path,
-                payload=result.to_dict(),
-                pretty=bool(runtime_config.get("output", {}).get("pretty_json", True)),
+                payload=payload,
+                pretty=pretty,
             )
+            written_payloads[output_path.name] = payload
             update_processed_registry(processed_registry, image)
             summary.append(
                 {
@@ -205,10 +201,13 @@ def cmd_batch(args: argparse.Namespace, config: dict[str, Any]) -> int:
                 }
             )
 
-    registry_path = save_processed_registry(processed_registry_path, processed_registry)
-    csv_path = write_summary_csv(output_dir)
+    registry_path = processed_registry_path
+    if succeeded or not registry_is_current:
+        registry_path = save_processed_registry(processed_registry_path, processed_registry)
+    results = load_result_payloads(output_dir, known=written_payloads)
+    csv_path = write_summary_csv(output_dir, results)
     notifier = NotificationService(runtime_config)
-    notify_result = notifier.notify_new_receipts(target_dir=target_dir, new_images=new_images)
+    notify_result = notifier.notify_new_receipts(target_dir=target_dir, new_images=new_images, results=results)
     if notify_result.sent_channels:
         channels = ",".join(sorted(notify_result.sent_channels))
         print(f"notification-sent channels={channels} new_receipts={len(new_images)}")
@@ -225,7 +224,7 @@ def cmd_batch(args: argparse.Namespace, config: dict[str, Any]) -> int:
 
 
 def cmd_compare_ocr(args: argparse.Namespace, config: dict[str, Any]) -> int:
-    engines = [e.strip() for e in args.ocr_engines.split(",") if e.strip()]
+    engines = [name for e in args.ocr_engines.split(",") if (name := e.strip())]
     if not engines:
         print("ocr engines are empty")
         return 1
@@ -239,6 +238,7 @@ def cmd_compare_ocr(args: argparse.Namespace, config: dict[str, Any]) -> int:
     output_dir = Path(args.target_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     summary: list[dict[str, Any]] = []
+    pretty = bool(runtime_config.get("output", {}).get("pretty_json", True))
 
     for engine in engines:
         try:
@@ -252,7 +252,7 @@ def cmd_compare_ocr(args: argparse.Namespace, config: dict[str, Any]) -> int:
             write_json(
                 output_path,
                 payload=result.to_dict(),
-                pretty=bool(runtime_config.get("output", {}).get("pretty_json", True)),
+                pretty=pretty,
             )
             summary.append(
                 {
@@ -289,7 +289,7 @@ def cmd_learn_template(args: argparse.Namespace, config: dict[str, Any]) -> int:
 
 
 def cmd_healthcheck_ocr(args: argparse.Namespace, config: dict[str, Any]) -> int:
-    engines = [e.strip() for e in args.ocr_engines.split(",") if e.strip()]
+    engines = [name for e in args.ocr_engines.split(",") if (name := e.strip())]
     if not engines:
         print("ocr engines are empty")
         return 1
@@ -326,7 +326,7 @@ def cmd_healthcheck_ocr(args: argparse.Namespace, config: dict[str, Any]) -> int
     return 0
 
 
-def cmd_refresh_summary(args: argparse.Namespace) -> int:
+def cmd_refresh_summary(args: argparse.Namespace, config: dict[str, Any]) -> int:
     target_dir = Path(args.target_dir)
     if not target_dir.exists() or not target_dir.is_dir():
         print(f"target directory not found: {target_dir}")
@@ -336,23 +336,24 @@ def cmd_refresh_summary(args: argparse.Namespace) -> int:
     return 0
 
 
+COMMAND_HANDLERS: dict[str, Callable[[argparse.Namespace, dict[str, Any]], int]] = {
+    "extract": cmd_extract,
+    "batch": cmd_batch,
+    "compare-ocr": cmd_compare_ocr,
+    "healthcheck-ocr": cmd_healthcheck_ocr,
+    "learn-template": cmd_learn_template,
+    "refresh-summary": cmd_refresh_summary,
+}
+
+
 def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
     config = load_config(args.config)
 
-    if args.command == "extract":
-        return cmd_extract(args, config)
-    if args.command == "batch":
-        return cmd_batch(args, config)
-    if args.command == "compare-ocr":
-        return cmd_compare_ocr(args, config)
-    if args.command == "healthcheck-ocr":
-        return cmd_healthcheck_ocr(args, config)
-    if args.command == "learn-template":
-        return cmd_learn_template(args, config)
-    if args.command == "refresh-summary":
-        return cmd_refresh_summary(args)
+    handler = COMMAND_HANDLERS.get(args.command)
+    if handler is not None:
+        return handler(args, config)
 
     parser.print_help()
     return 1
@@ -13,12 +13,19 @@ from extractors.date_extractor import DateExtractor
 from extractors.facility_extractor import FacilityExtractor
 from extractors.family_name_extractor import FamilyNameExtractor
 from io_utils.image_loader import get_image_size
-from ocr.factory import create_ocr_adapter
+from ocr.base import OCRAdapter
+from ocr.factory import canonical_engine_name, create_ocr_adapter
 from ocr.normalizer import OCRNormalizer
 from resolver.decision_resolver import resolver_from_config
 from templates.matcher import TemplateMatcher
 from templates.store import TemplateStore
 
+FAMILY_SOURCE_AUDIT_NOTES = {
+    "family_registry": "family_member_registry_matched",
+    "family_registry_same_surname": "family_member_unregistered_same_surname",
+    "family_registry_unknown_surname": "family_member_unregistered_different_surname",
+}
+
 
 class ReceiptExtractionPipeline:
     def __init__(self, config: dict[str, Any]) -> None:
@@ -37,9 +44,10 @@ class ReceiptExtractionPipeline:
         self.resolver = resolver_from_config(config)
         self.normalizer = OCRNormalizer()
         self.audit_logger = AuditLogger()
+        self._ocr_adapter: tuple[str, OCRAdapter] | None = None
 
     def process(self, image_path: str, household_id: str | None, ocr_engine: str) -> ExtractionResult:
-        adapter = create_ocr_adapter(ocr_engine, self.config)
+        adapter = self._get_ocr_adapter(ocr_engine)
         raw = adapter.run(image_path)
         image_size = get_image_size(image_path)
         lines = self.normalizer.normalize(raw=raw, image_size=image_size)
@@ -70,8 +78,8 @@ class ReceiptExtractionPipeline:
             template_candidates = self.template_matcher.apply_template(matched_template, lines)
             self._merge_candidate_pool(candidate_pool, template_candidates)
 
-        for key in candidate_pool:
-            candidate_pool[key] = sorted(candidate_pool[key], key=lambda c: c.score, reverse=True)
+        for candidates in candidate_pool.values():
+            candidates.sort(key=lambda c: c.score, reverse=True)
 
         selected_fields, decision = self.resolver.resolve(
             candidate_pool=candidate_pool,
@@ -93,12 +101,10 @@ class ReceiptExtractionPipeline:
         family_member = selected_fields.get(FieldName.FAMILY_MEMBER_NAME)
         if family_member is None:
             audit.notes.append("family_member_not_detected")
-        elif family_member.source == "family_registry":
-            audit.notes.append("family_member_registry_matched")
-        elif family_member.source == "family_registry_same_surname":
-            audit.notes.append("family_member_unregistered_same_surname")
-        elif family_member.source == "family_registry_unknown_surname":
-            audit.notes.append("family_member_unregistered_different_surname")
+        else:
+            family_note = FAMILY_SOURCE_AUDIT_NOTES.get(family_member.source)
+            if family_note is not None:
+                audit.notes.append(family_note)
 
         document_id = self._build_document_id(image_path)
         result = ExtractionResult(
@@ -114,6 +120,14 @@ class ReceiptExtractionPipeline:
         )
         return result
 
+    def _get_ocr_adapter(self, ocr_engine: str) -> OCRAdapter:
+        engine_name = canonical_engine_name(ocr_engine or str(self.config.get("ocr", {}).get("engine", "yomitoku")))
+        if self._ocr_adapter is None or self._ocr_adapter[0] != engine_name:
+            # Keep only the active engine so switching engines never holds two models at once.
+            self._ocr_adapter = None
+            self._ocr_adapter = (engine_name, create_ocr_adapter(engine_name, self.config))
+        return self._ocr_adapter[1]
+
     @staticmethod
     def _merge_candidate_pool(
         target: dict[str, list[Candidate]],
@@ -133,13 +147,14 @@ class ReceiptExtractionPipeline:
         if family_member is None:
             return decision
 
-        reasons = list(decision.reasons)
         if family_member.source == "family_registry_unknown_surname":
+            reasons = list(decision.reasons)
             if "family_name_not_in_registry_different_surname" not in reasons:
                 reasons.append("family_name_not_in_registry_different_surname")
             return Decision(status=DecisionStatus.REJECTED, confidence=decision.confidence, reasons=reasons)
 
         if family_member.source == "family_registry_same_surname" and decision.status != DecisionStatus.REJECTED:
+            reasons = list(decision.reasons)
             if "family_name_not_in_registry_same_surname" not in reasons:
                 reasons.append("family_name_not_in_registry_same_surname")
             return Decision(status=DecisionStatus.REVIEW_REQUIRED, confidence=decision.confidence, reasons=reasons)
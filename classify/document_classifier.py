@@ -8,6 +8,8 @@ from core.models import OCRLine
 PHARMACY_KEYWORDS = ("薬局", "調剤", "処方箋", "保険薬局", "ファーマシー")
 CLINIC_KEYWORDS = ("病院", "医院", "クリニック", "診療所")
 
+RE_PRESCRIPTION_BLOCK = re.compile(r"処方箋交付|保険医療機関")
+
 
 def _has_prescription_keyword(text: str) -> bool:
     return "処方箋" in text and "処方箋料" not in text
@@ -38,7 +40,7 @@ class DocumentClassifier:
                     clinic_score += 1.2
                     reasons.append(f"clinic_keyword:{kw}")
 
-            if re.search(r"処方箋交付|保険医療機関", text):
+            if RE_PRESCRIPTION_BLOCK.search(text):
                 pharmacy_score += 0.8
                 reasons.append("pharmacy_context:prescription_block")
 
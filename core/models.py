@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field, is_dataclass
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
@@ -21,7 +21,7 @@ def _serialize(value: Any) -> Any:
     if isinstance(value, Enum):
         return value.value
     if is_dataclass(value):
-        return {k: _serialize(v) for k, v in asdict(value).items()}
+        return {f.name: _serialize(getattr(value, f.name)) for f in fields(value)}
     if isinstance(value, tuple):
         return [_serialize(v) for v in value]
     if isinstance(value, list):
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
 from core.enums import FieldName
@@ -14,8 +14,8 @@ def _normalize_date(value: Any) -> str | None:
     if not text:
         return None
     try:
-        if len(text) == 10 and text[4] == "-" and text[7] == "-":
-            datetime.strptime(text, "%Y-%m-%d")
+        if len(text) == 10 and text[4] == "-" and text[7] == "-" and text.isascii():
+            date.fromisoformat(text)
             return text
         dt = datetime.fromisoformat(text)
         return dt.date().isoformat()
@@ -48,7 +48,7 @@ def extract_result_value(result: dict[str, Any], field_name: str) -> Any:
     return candidate.get("value_normalized")
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldMetric:
     total: int = 0
     correct: int = 0
@@ -60,7 +60,7 @@ class FieldMetric:
         return self.correct / self.total
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalMetrics:
     by_field: dict[str, FieldMetric] = field(
         default_factory=lambda: {
@@ -18,6 +18,7 @@ PRIMARY_NEAR_SUFFIX = ("額", "金額")
 NEGATIVE_SIGNS = ("-", "−", "－", "△", "▲", "▵")
 LARGE_TEXT_HEIGHT_THRESHOLD = 0.022
 SMALL_TEXT_HEIGHT_THRESHOLD = 0.012
+AMOUNT_SEPARATOR_DELETE_TABLE = str.maketrans("", "", ",，")
 
 RE_AMOUNT = re.compile(r"(?:[¥￥]\s*)?(?P<value>\d{1,3}(?:,\d{3})+|\d+)\s*(?:円)?")
 RE_IDENTIFIER_NO = re.compile(r"\b(?:NO|No)\.?\s*\d", re.IGNORECASE)
@@ -26,9 +27,21 @@ RE_IDENTIFIER_NO = re.compile(r"\b(?:NO|No)\.?\s*\d", re.IGNORECASE)
 class AmountExtractor:
     def extract(self, lines: list[OCRLine]) -> list[Candidate]:
         candidates: list[Candidate] = []
-
-        for line in lines:
-            text = normalize_spaces(line.text)
+        texts = [normalize_spaces(line.text) for line in lines]
+        primary_label_lines: list[OCRLine] = []
+        secondary_label_lines: list[OCRLine] = []
+        exclude_context_lines: list[OCRLine] = []
+        for line, text in zip(lines, texts):
+            if any(keyword in text for keyword in PRIMARY_NEAR_BASE) and any(
+                keyword in text for keyword in PRIMARY_NEAR_SUFFIX
+            ):
+                primary_label_lines.append(line)
+            if any(keyword in text for keyword in AMOUNT_LABEL_SECONDARY):
+                secondary_label_lines.append(line)
+            if any(keyword in text for keyword in AMOUNT_EXCLUDE_CONTEXT):
+                exclude_context_lines.append(line)
+
+        for line, text in zip(lines, texts):
             matches = list(RE_AMOUNT.finditer(text))
             if not matches:
                 continue
@@ -38,9 +51,9 @@ class AmountExtractor:
             has_exclude_context = any(keyword in text for keyword in AMOUNT_EXCLUDE_CONTEXT)
             has_date_context = any(keyword in text for keyword in DATE_CONTEXT)
             has_contact_context = any(keyword in text.upper() for keyword in CONTACT_CONTEXT)
-            near_primary_label = self._has_nearby_primary_amount_label(line, lines)
-            near_secondary_label = self._has_nearby_keyword(line, lines, AMOUNT_LABEL_SECONDARY)
-            near_exclude_context = self._has_nearby_keyword(line, lines, AMOUNT_EXCLUDE_CONTEXT)
+            near_primary_label = self._has_nearby_line(line, primary_label_lines)
+            near_secondary_label = self._has_nearby_line(line, secondary_label_lines)
+            near_exclude_context = self._has_nearby_line(line, exclude_context_lines)
             has_identifier_context = self._has_identifier_context(text)
 
             for match in matches:
@@ -121,7 +134,7 @@ class AmountExtractor:
                 if value > 10_000_000:
                     score -= 2.0
                     reasons.append("outlier_penalty")
-                if value < 10 and not any(keyword in text for keyword in AMOUNT_LABEL_PRIMARY):
+                if value < 10 and not has_primary_label:
                     score -= 1.0
                     reasons.append("small_amount_penalty")
                 if 1900 <= value <= 2100 and not has_currency:
@@ -147,37 +160,23 @@ class AmountExtractor:
                     )
                 )
 
-        return sorted(candidates, key=lambda c: (c.score, c.ocr_confidence), reverse=True)
-
-    @staticmethod
-    def _has_nearby_keyword(line: OCRLine, lines: list[OCRLine], keywords: tuple[str, ...]) -> bool:
-        for other in lines:
-            if other.line_index == line.line_index:
-                continue
-            text = normalize_spaces(other.text)
-            if not any(keyword in text for keyword in keywords):
-                continue
-            if is_near_line(line, other, vertical_tol=0.06, horizontal_tol=0.8):
-                return True
-        return False
+        candidates.sort(key=lambda c: (c.score, c.ocr_confidence), reverse=True)
+        return candidates
 
     @staticmethod
-    def _has_nearby_primary_amount_label(line: OCRLine, lines: list[OCRLine]) -> bool:
-        for other in lines:
+    def _has_nearby_line(line: OCRLine, label_lines: list[OCRLine]) -> bool:
+        for other in label_lines:
             if other.line_index == line.line_index:
                 continue
-            text = normalize_spaces(other.text)
-            has_base = any(keyword in text for keyword in PRIMARY_NEAR_BASE)
-            has_suffix = any(keyword in text for keyword in PRIMARY_NEAR_SUFFIX)
-            if not (has_base and has_suffix):
-                continue
             if is_near_line(line, other, vertical_tol=0.06, horizontal_tol=0.8):
                 return True
         return False
 
     @staticmethod
     def _parse_amount(amount_text: str) -> int | None:
-        normalized = amount_text.replace(",", "").replace("，", "").strip()
+        if amount_text.isascii() and amount_text.isdigit():
+            return int(amount_text)
+        normalized = amount_text.translate(AMOUNT_SEPARATOR_DELETE_TABLE).strip()
         if not normalized.isdigit():
             return None
         try:
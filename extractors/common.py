@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import math
-import re
 from typing import Iterable
 
 from core.models import BBox, OCRLine
@@ -16,7 +15,7 @@ def count_digits(text: str) -> int:
 
 
 def normalize_spaces(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return " ".join(text.split())
 
 
 def merge_bboxes(bboxes: list[BBox]) -> BBox | None:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from typing import Optional
 
 from core.enums import FieldName
@@ -27,21 +27,33 @@ RE_HEISEI_TEXT = re.compile(
     r"平成\s*(?P<year>元|\d{1,2})\s*年\s*(?P<month>\d{1,2})\s*月\s*(?P<day>\d{1,2})\s*日?"
 )
 RE_MONTH_DAY = re.compile(r"(?<!\d)(?P<month>\d{1,2})\s*[\/\-.月]\s*(?P<day>\d{1,2})\s*日?")
+RE_ANY_DIGIT = re.compile(r"\d")
+# Leap year, so 02-29 stays valid for month-day-only dates.
+VALID_MONTH_DAYS = frozenset(
+    (day.month, day.day) for day in (date(2000, 1, 1) + timedelta(days=offset) for offset in range(366))
+)
 
 
 class DateExtractor:
     def extract(self, lines: list[OCRLine]) -> list[Candidate]:
         candidates: list[Candidate] = []
-        preferred_label_lines = [
-            line for line in lines if any(label in normalize_spaces(line.text) for label in DATE_LABEL_PRIORITY)
-        ]
-        lower_priority_label_lines = [
-            line for line in lines if any(label in normalize_spaces(line.text) for label in DATE_LABEL_DEPRIORITY)
-        ]
-
+        today = date.today()
+        future_limit = today + timedelta(days=7)
+        scanned: list[tuple[OCRLine, str, bool, bool]] = []
+        preferred_label_lines: list[OCRLine] = []
+        lower_priority_label_lines: list[OCRLine] = []
         for line in lines:
             text = normalize_spaces(line.text)
-            parsed = self._parse_date(text)
+            has_preferred = any(label in text for label in DATE_LABEL_PRIORITY)
+            has_lower_priority = any(label in text for label in DATE_LABEL_DEPRIORITY)
+            scanned.append((line, text, has_preferred, has_lower_priority))
+            if has_preferred:
+                preferred_label_lines.append(line)
+            if has_lower_priority:
+                lower_priority_label_lines.append(line)
+
+        for line, text, has_preferred, has_lower_priority in scanned:
+            parsed = self._parse_date(text, today=today)
             if parsed is None:
                 continue
 
@@ -51,7 +63,7 @@ class DateExtractor:
             source_line_indices = [line.line_index]
             candidate_bbox = line.bbox
 
-            if any(label in text for label in DATE_LABEL_PRIORITY):
+            if has_preferred:
                 score += 3.0
                 reasons.append("has_preferred_date_label")
             else:
@@ -64,7 +76,7 @@ class DateExtractor:
                     if merged is not None:
                         candidate_bbox = merged
 
-            if any(label in text for label in DATE_LABEL_DEPRIORITY):
+            if has_lower_priority:
                 score -= 0.7
                 reasons.append("has_lower_priority_date_label")
             else:
@@ -83,7 +95,7 @@ class DateExtractor:
             if year_missing:
                 score -= 2.0
                 reasons.append("year_missing_hold_candidate")
-            elif parsed_date is not None and parsed_date > date.today() + timedelta(days=7):
+            elif parsed_date is not None and parsed_date > future_limit:
                 score -= 2.0
                 reasons.append("future_date_penalty")
 
@@ -99,7 +111,8 @@ class DateExtractor:
                     reasons=reasons if reasons else ["date_pattern_match"],
                 )
             )
-        return sorted(candidates, key=lambda c: c.score, reverse=True)
+        candidates.sort(key=lambda c: c.score, reverse=True)
+        return candidates
 
     @staticmethod
     def _find_nearby_label_line(target: OCRLine, labels: list[OCRLine]) -> OCRLine | None:
@@ -110,24 +123,28 @@ class DateExtractor:
                 return label
         return None
 
-    def _parse_date(self, text: str) -> Optional[tuple[str, Optional[date], bool]]:
-        for regex in (RE_GREGORIAN,):
-            match = regex.search(text)
-            if match:
-                parsed = self._build_date(
-                    int(match.group("year")),
-                    int(match.group("month")),
-                    int(match.group("day")),
-                )
-                if parsed is not None:
-                    return (parsed.isoformat(), parsed, False)
+    @staticmethod
+    def _parse_date(text: str, today: date | None = None) -> Optional[tuple[str, Optional[date], bool]]:
+        # Every date pattern needs at least one digit.
+        if not RE_ANY_DIGIT.search(text):
+            return None
+        match = RE_GREGORIAN.search(text)
+        if match:
+            parsed = DateExtractor._build_date(
+                int(match.group("year")),
+                int(match.group("month")),
+                int(match.group("day")),
+            )
+            if parsed is not None:
+                return (parsed.isoformat(), parsed, False)
 
         match = RE_ERALESS_SHORT_YMD.search(text)
         if match:
-            parsed = self._resolve_era_without_marker(
+            parsed = DateExtractor._resolve_era_without_marker(
                 year=int(match.group("year")),
                 month=int(match.group("month")),
                 day=int(match.group("day")),
+                today=today,
             )
             if parsed is not None:
                 return (parsed.isoformat(), parsed, False)
@@ -138,33 +155,36 @@ class DateExtractor:
             month = int(match.group("month"))
             day = int(match.group("day"))
             if match.group("era").lower() == "r":
-                parsed = self._build_date(2018 + year, month, day)
+                parsed = DateExtractor._build_date(2018 + year, month, day)
             else:
-                parsed = self._build_date(1988 + year, month, day)
+                parsed = DateExtractor._build_date(1988 + year, month, day)
             if parsed is not None:
                 return (parsed.isoformat(), parsed, False)
 
-        match = RE_REIWA_TEXT.search(text)
-        if match:
-            year_text = match.group("year")
-            year = 1 if year_text == "元" else int(year_text)
-            parsed = self._build_date(2018 + year, int(match.group("month")), int(match.group("day")))
-            if parsed is not None:
-                return (parsed.isoformat(), parsed, False)
+        # Each era pattern starts with its literal era name; skip the regex when it is absent.
+        if "令和" in text:
+            match = RE_REIWA_TEXT.search(text)
+            if match:
+                year_text = match.group("year")
+                year = 1 if year_text == "元" else int(year_text)
+                parsed = DateExtractor._build_date(2018 + year, int(match.group("month")), int(match.group("day")))
+                if parsed is not None:
+                    return (parsed.isoformat(), parsed, False)
 
-        match = RE_HEISEI_TEXT.search(text)
-        if match:
-            year_text = match.group("year")
-            year = 1 if year_text == "元" else int(year_text)
-            parsed = self._build_date(1988 + year, int(match.group("month")), int(match.group("day")))
-            if parsed is not None:
-                return (parsed.isoformat(), parsed, False)
+        if "平成" in text:
+            match = RE_HEISEI_TEXT.search(text)
+            if match:
+                year_text = match.group("year")
+                year = 1 if year_text == "元" else int(year_text)
+                parsed = DateExtractor._build_date(1988 + year, int(match.group("month")), int(match.group("day")))
+                if parsed is not None:
+                    return (parsed.isoformat(), parsed, False)
 
         match = RE_MONTH_DAY.search(text)
         if match:
             month = int(match.group("month"))
             day = int(match.group("day"))
-            if 1 <= month <= 12 and 1 <= day <= 31:
+            if (month, day) in VALID_MONTH_DAYS:
                 return (f"{month:02d}-{day:02d}", None, True)
 
         return None
@@ -172,12 +192,12 @@ class DateExtractor:
     @staticmethod
     def _build_date(year: int, month: int, day: int) -> Optional[date]:
         try:
-            return datetime(year=year, month=month, day=day).date()
+            return date(year, month, day)
         except ValueError:
             return None
 
     @staticmethod
-    def _resolve_era_without_marker(year: int, month: int, day: int) -> Optional[date]:
+    def _resolve_era_without_marker(year: int, month: int, day: int, today: date | None = None) -> Optional[date]:
         if year <= 0:
             return None
 
@@ -190,8 +210,11 @@ class DateExtractor:
             candidates.append(heisei)
         if not candidates:
             return None
+        if len(candidates) == 1:
+            return candidates[0]
 
-        today = date.today()
+        if today is None:
+            today = date.today()
         horizon = today + timedelta(days=31)
         non_future = [d for d in candidates if d <= horizon]
         pool = non_future if non_future else candidates
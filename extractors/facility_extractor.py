@@ -8,6 +8,7 @@ from extractors.common import contains_any, count_digits, is_near_line, is_top_r
 
 PHARMACY_KEYWORDS = ("薬局", "調剤", "ファーマシー", "保険薬局")
 CLINIC_KEYWORDS = ("病院", "医院", "クリニック", "診療所")
+FACILITY_KEYWORDS = PHARMACY_KEYWORDS + CLINIC_KEYWORDS
 PRESCRIBING_CONTEXT = ("処方箋", "保険医療機関", "交付", "医師")
 CONTACT_ANCHORS = ("〒", "TEL", "領収書", "発行")
 NON_NAME_HINTS = (
@@ -37,7 +38,8 @@ NON_NAME_HINTS = (
     "領収証",
     "調剤明細書",
 )
-NON_NAME_EXACT = {"調剤", "明細", "領収", "合計", "内訳"}
+NON_NAME_HINTS_COMPACT = tuple(key.replace(" ", "") for key in NON_NAME_HINTS)
+NON_NAME_EXACT = frozenset({"調剤", "明細", "領収", "合計", "内訳"})
 
 RE_NAME_PREFIX = re.compile(
     r"^(処方箋交付医療機関|保険医療機関|医療機関名|病院名|医院名|薬局名|調剤薬局名)\s*[:：]?\s*"
@@ -53,8 +55,12 @@ class FacilityExtractor:
         if not lines:
             return candidates
 
-        contact_lines = [line for line in lines if contains_any(line.text, CONTACT_ANCHORS)]
-        prescribing_lines = [line for line in lines if contains_any(line.text, PRESCRIBING_CONTEXT)]
+        contact_lines: list[OCRLine] = []
+        prescribing_lines: list[OCRLine] = []
+        if document_type in (DocumentType.PHARMACY, DocumentType.CLINIC_OR_HOSPITAL):
+            contact_lines = [line for line in lines if contains_any(line.text, CONTACT_ANCHORS)]
+        if document_type == DocumentType.PHARMACY:
+            prescribing_lines = [line for line in lines if contains_any(line.text, PRESCRIBING_CONTEXT)]
 
         for line in lines:
             cleaned = self._clean_name(line.text)
@@ -62,11 +68,14 @@ class FacilityExtractor:
                 continue
 
             if document_type == DocumentType.PHARMACY:
-                payer = self._score_pharmacy_payer(line, cleaned, contact_lines, prescribing_lines)
+                near_prescribing = contains_any(line.text, PRESCRIBING_CONTEXT) or self._near_any(
+                    line, prescribing_lines
+                )
+                payer = self._score_pharmacy_payer(line, cleaned, contact_lines, near_prescribing)
                 if payer is not None:
                     candidates[FieldName.PAYER_FACILITY_NAME].append(payer)
 
-                prescribing = self._score_pharmacy_prescribing(line, cleaned, prescribing_lines)
+                prescribing = self._score_pharmacy_prescribing(line, cleaned, near_prescribing)
                 if prescribing is not None:
                     candidates[FieldName.PRESCRIBING_FACILITY_NAME].append(prescribing)
             elif document_type == DocumentType.CLINIC_OR_HOSPITAL:
@@ -87,7 +96,7 @@ class FacilityExtractor:
         line: OCRLine,
         cleaned_text: str,
         contact_lines: list[OCRLine],
-        prescribing_lines: list[OCRLine],
+        near_prescribing: bool,
     ) -> Candidate | None:
         score = 1.0
         reasons: list[str] = []
@@ -102,7 +111,7 @@ class FacilityExtractor:
         if self._near_any(line, contact_lines):
             score += 2.0
             reasons.append("near_anchor:contact")
-        if contains_any(text, PRESCRIBING_CONTEXT) or self._near_any(line, prescribing_lines):
+        if near_prescribing:
             score -= 4.0
             reasons.append("near_prescribing_context_penalty")
         if contains_any(text, CLINIC_KEYWORDS):
@@ -126,13 +135,13 @@ class FacilityExtractor:
         self,
         line: OCRLine,
         cleaned_text: str,
-        prescribing_lines: list[OCRLine],
+        near_prescribing: bool,
     ) -> Candidate | None:
         score = 0.8
         reasons: list[str] = []
         text = line.text
 
-        if contains_any(text, PRESCRIBING_CONTEXT) or self._near_any(line, prescribing_lines):
+        if near_prescribing:
             score += 3.0
             reasons.append("near_prescribing_anchor")
         if contains_any(text, CLINIC_KEYWORDS):
@@ -239,7 +248,7 @@ class FacilityExtractor:
     @staticmethod
     def _looks_like_name(text: str) -> bool:
         t = normalize_spaces(text)
-        compact = re.sub(r"\s+", "", t)
+        compact = t.replace(" ", "")
         if not t:
             return False
         upper_t = t.upper()
@@ -249,14 +258,13 @@ class FacilityExtractor:
             return False
         if any(key in t for key in NON_NAME_HINTS):
             return False
-        compact_hints = tuple(key.replace(" ", "") for key in NON_NAME_HINTS)
-        if any(key in compact for key in compact_hints):
+        if any(key in compact for key in NON_NAME_HINTS_COMPACT):
             return False
         if compact in NON_NAME_EXACT:
             return False
         if compact.endswith(("様", "殿")):
             return False
-        if ":" in t and not contains_any(t, PHARMACY_KEYWORDS + CLINIC_KEYWORDS):
+        if ":" in t and not contains_any(t, FACILITY_KEYWORDS):
             return False
         digits = count_digits(t)
         if digits and digits / max(1, len(t)) > 0.35:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Any
 
 from core.enums import FieldName
@@ -32,7 +33,9 @@ NON_NAME_HINTS = (
 )
 RE_LABEL_PREFIX = re.compile(r"^(?:患者氏名|患者名|氏名|受診者氏名|受診者|お名前)\s*[:：]?\s*")
 RE_HONORIFIC_SUFFIX = re.compile(r"\s*(?:様|殿)\s*$")
-RE_JP_NAME_CHARS = re.compile(r"^[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFFー・\s]+$")
+RE_JP_NAME_CHARS = re.compile(r"[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFFー・\s]+")
+NAME_KEY_DELETE_TABLE = str.maketrans("", "", "・･.")
+FUZZY_MATCH_THRESHOLD = 0.85
 
 
 class FamilyRegistryError(ValueError):
@@ -52,12 +55,14 @@ class FamilyRegistry:
         self.required = bool(conf.get("required", True))
         self.members: list[FamilyMember] = []
         self.alias_to_canonical: dict[str, str] = {}
+        self.canonical_keys: dict[str, str] = {}
         self.surname_keys: set[str] = set()
 
         members = conf.get("members", [])
         if not isinstance(members, list):
             members = []
         self._load_members(members)
+        self.surname_key_prefixes = tuple(self.surname_keys)
 
         if self.required and not self.members:
             raise FamilyRegistryError(
@@ -65,6 +70,7 @@ class FamilyRegistry:
             )
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def normalize_name(text: str) -> str:
         cleaned = normalize_spaces(text)
         cleaned = RE_LABEL_PREFIX.sub("", cleaned)
@@ -72,18 +78,19 @@ class FamilyRegistry:
         return cleaned.strip(" :：")
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def normalize_key(text: str) -> str:
         cleaned = FamilyRegistry.normalize_name(text)
-        return re.sub(r"[\s　・･\.]", "", cleaned).lower()
+        return "".join(cleaned.translate(NAME_KEY_DELETE_TABLE).split()).lower()
 
     @staticmethod
     def extract_surname(name: str) -> str:
         cleaned = FamilyRegistry.normalize_name(name)
         if not cleaned:
             return ""
-        parts = cleaned.split(" ")
-        if len(parts) >= 2 and parts[0]:
-            return parts[0]
+        surname, separator, _ = cleaned.partition(" ")
+        if separator and surname:
+            return surname
         return cleaned[:2] if len(cleaned) >= 2 else cleaned
 
     def resolve(self, name: str) -> tuple[str, str, str, float]:
@@ -94,8 +101,7 @@ class FamilyRegistry:
 
         canonical = self.alias_to_canonical.get(key)
         if canonical is not None:
-            canonical_key = self.normalize_key(canonical)
-            if key == canonical_key:
+            if key == self.canonical_keys[canonical]:
                 return canonical, "family_registry", "family_name_exact_match", 6.2
             return canonical, "family_registry", "family_name_alias_match", 5.8
 
@@ -104,7 +110,7 @@ class FamilyRegistry:
             canonical, similarity = fuzzy
             return canonical, "family_registry", f"family_name_alias_fuzzy_match:{similarity:.2f}", 5.2
 
-        if self._has_same_surname(normalized):
+        if self._has_same_surname(key):
             return normalized, "family_registry_same_surname", "family_name_unregistered_same_surname", 4.0
         return normalized, "family_registry_unknown_surname", "family_name_unregistered_different_surname", 4.0
 
@@ -112,13 +118,13 @@ class FamilyRegistry:
         for member in members:
             if not isinstance(member, dict):
                 continue
-            canonical = normalize_spaces(str(member.get("canonical_name", ""))).strip()
+            canonical = normalize_spaces(str(member.get("canonical_name", "")))
             if not canonical:
                 continue
             aliases = member.get("aliases", [])
             if not isinstance(aliases, list):
                 aliases = []
-            normalized_aliases = [normalize_spaces(str(alias)).strip() for alias in aliases if str(alias).strip()]
+            normalized_aliases = [normalized for alias in aliases if (normalized := normalize_spaces(str(alias)))]
             record = FamilyMember(
                 canonical_name=canonical,
                 aliases=normalized_aliases,
@@ -127,6 +133,7 @@ class FamilyRegistry:
             self.members.append(record)
 
             canonical_key = self.normalize_key(canonical)
+            self.canonical_keys[canonical] = canonical_key
             if canonical_key:
                 self.alias_to_canonical[canonical_key] = canonical
             for alias in normalized_aliases:
@@ -142,22 +149,20 @@ class FamilyRegistry:
         best_similarity = 0.0
         best_canonical: str | None = None
         for alias_key, canonical in self.alias_to_canonical.items():
-            similarity = SequenceMatcher(None, key, alias_key).ratio()
+            matcher = SequenceMatcher(None, key, alias_key)
+            floor = max(best_similarity, FUZZY_MATCH_THRESHOLD)
+            if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                continue
+            similarity = matcher.ratio()
             if similarity > best_similarity:
                 best_similarity = similarity
                 best_canonical = canonical
-        if best_canonical is None or best_similarity < 0.85:
+        if best_canonical is None or best_similarity < FUZZY_MATCH_THRESHOLD:
             return None
         return best_canonical, best_similarity
 
-    def _has_same_surname(self, name: str) -> bool:
-        key = self.normalize_key(name)
-        if not key:
-            return False
-        for surname_key in self.surname_keys:
-            if key.startswith(surname_key):
-                return True
-        return False
+    def _has_same_surname(self, key: str) -> bool:
+        return key.startswith(self.surname_key_prefixes)
 
 
 class FamilyNameExtractor:
@@ -168,7 +173,8 @@ class FamilyNameExtractor:
         candidates: list[Candidate] = []
         for line in lines:
             candidates.extend(self._extract_from_line(line))
-        return sorted(candidates, key=lambda c: (c.score, c.ocr_confidence), reverse=True)
+        candidates.sort(key=lambda c: (c.score, c.ocr_confidence), reverse=True)
+        return candidates
 
     def _extract_from_line(self, line: OCRLine) -> list[Candidate]:
         text = normalize_spaces(line.text)
@@ -211,32 +217,30 @@ class FamilyNameExtractor:
 
     @staticmethod
     def _build_name_possibilities(text: str) -> list[str]:
-        t = normalize_spaces(text)
         candidates: list[str] = []
 
-        if any(label in t for label in NAME_LABELS):
-            stripped = RE_LABEL_PREFIX.sub("", t).strip(" :：")
+        if any(label in text for label in NAME_LABELS):
+            stripped = RE_LABEL_PREFIX.sub("", text).strip(" :：")
             if stripped:
                 candidates.append(stripped)
-        if t.endswith(("様", "殿")):
-            stripped = RE_HONORIFIC_SUFFIX.sub("", t).strip()
+        if text.endswith(("様", "殿")):
+            stripped = RE_HONORIFIC_SUFFIX.sub("", text).strip()
             if stripped:
                 candidates.append(stripped)
-        candidates.append(t)
-        return candidates
+        candidates.append(text)
+        return list(dict.fromkeys(candidates))
 
     @staticmethod
     def _looks_like_person_name(text: str) -> bool:
-        t = normalize_spaces(text)
-        if not t:
+        if not text:
             return False
-        if any(hint in t for hint in NON_NAME_HINTS):
+        if any(hint in text for hint in NON_NAME_HINTS):
             return False
-        if count_digits(t) > 0:
+        if count_digits(text) > 0:
             return False
-        compact = re.sub(r"\s+", "", t)
+        compact = text.replace(" ", "")
         if len(compact) < 2 or len(compact) > 24:
             return False
-        if not RE_JP_NAME_CHARS.match(t):
+        if not RE_JP_NAME_CHARS.fullmatch(text):
             return False
         return True
@@ -11,18 +11,19 @@ REGISTRY_VERSION = 1
 
 
 def load_processed_registry(path: str | Path) -> dict[str, dict[str, int]]:
-    registry_path = Path(path)
-    if not registry_path.exists():
-        return {}
+    registry, _ = read_processed_registry(path)
+    return registry
+
 
+def read_processed_registry(path: str | Path) -> tuple[dict[str, dict[str, int]], bool]:
     try:
-        payload = load_json(registry_path)
+        payload = load_json(path)
     except Exception:
-        return {}
+        return {}, False
 
     items = payload.get("items")
     if not isinstance(items, dict):
-        return {}
+        return {}, False
 
     registry: dict[str, dict[str, int]] = {}
     for key, value in items.items():
@@ -33,15 +34,11 @@ def load_processed_registry(path: str | Path) -> dict[str, dict[str, int]]:
         if size is None or mtime_ns is None:
             continue
         registry[key] = {"size": size, "mtime_ns": mtime_ns}
-    return registry
+    return registry, payload == _registry_payload(registry)
 
 
 def save_processed_registry(path: str | Path, registry: dict[str, dict[str, int]]) -> Path:
-    payload = {
-        "version": REGISTRY_VERSION,
-        "items": registry,
-    }
-    return write_json(path, payload, pretty=True)
+    return write_json(path, _registry_payload(registry), pretty=True)
 
 
 def is_already_processed(registry: dict[str, dict[str, int]], image_path: Path) -> bool:
@@ -60,16 +57,30 @@ def update_processed_registry(registry: dict[str, dict[str, int]], image_path: P
     }
 
 
-def write_summary_csv(output_dir: str | Path) -> Path:
+def load_result_payloads(
+    output_dir: str | Path,
+    known: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    payloads: dict[str, dict[str, Any]] = {}
+    for result_path in sorted(Path(output_dir).glob("*.result.json")):
+        if known is not None and result_path.name in known:
+            payloads[result_path.name] = known[result_path.name]
+            continue
+        try:
+            payloads[result_path.name] = load_json(result_path)
+        except Exception:
+            continue
+    return payloads
+
+
+def write_summary_csv(output_dir: str | Path, results: dict[str, dict[str, Any]] | None = None) -> Path:
     base = Path(output_dir)
     csv_path = base / "summary.csv"
     rows: list[list[str]] = []
+    if results is None:
+        results = load_result_payloads(base)
 
-    for result_path in sorted(base.glob("*.result.json")):
-        try:
-            result = load_json(result_path)
-        except Exception:
-            continue
+    for result in results.values():
         fields = result.get("fields", {})
         if not isinstance(fields, dict):
             fields = {}
@@ -90,6 +101,13 @@ def write_summary_csv(output_dir: str | Path) -> Path:
     return csv_path
 
 
+def _registry_payload(registry: dict[str, dict[str, int]]) -> dict[str, Any]:
+    return {
+        "version": REGISTRY_VERSION,
+        "items": registry,
+    }
+
+
 def _build_signature(path: Path) -> dict[str, Any]:
     resolved = path.resolve()
     stat = resolved.stat()
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 import re
 from typing import Any, Callable
 
 from core.enums import FieldName
-from io_utils.json_writer import load_json
+from io_utils.batch_progress import load_result_payloads
 from notifications.factory import build_notification_channels
 
+RE_NON_AMOUNT_CHARS = re.compile(r"[^\d\-]")
+
 
 @dataclass(slots=True)
 class NotificationResult:
@@ -30,36 +33,50 @@ class NotificationService:
         nconf = config.get("notifications", {})
         self.enabled = bool(nconf.get("enabled", False))
         self.max_items = _safe_int(nconf.get("max_items_in_message", 10), default=10, minimum=1)
-        self._channels, self._build_errors = channel_builder(config)
+        self._channels: dict[str, Any] = {}
+        self._build_errors: dict[str, str] = {}
+        if self.enabled:
+            self._channels, self._build_errors = channel_builder(config)
 
-    def notify_new_receipts(self, target_dir: Path, new_images: list[Path]) -> NotificationResult:
+    def notify_new_receipts(
+        self,
+        target_dir: Path,
+        new_images: list[Path],
+        results: dict[str, dict[str, Any]] | None = None,
+    ) -> NotificationResult:
         if not self.enabled or not new_images:
             return NotificationResult(sent_channels=[], failed_channels={}, skipped=True)
 
-        message = self._build_new_receipts_message(target_dir, new_images)
+        if results is None:
+            results = load_result_payloads(target_dir)
+        message = self._build_new_receipts_message(results, new_images)
         sent: list[str] = []
         failed = dict(self._build_errors)
 
-        for name, notifier in self._channels.items():
+        if not self._channels:
+            return NotificationResult(sent_channels=sent, failed_channels=failed, message=message, skipped=False)
+
+        with ThreadPoolExecutor(max_workers=len(self._channels)) as executor:
+            futures = {name: executor.submit(notifier.send, message) for name, notifier in self._channels.items()}
+        for name, future in futures.items():
             try:
-                notifier.send(message)
+                future.result()
                 sent.append(name)
             except Exception as exc:  # noqa: BLE001
                 failed[name] = str(exc)
 
         return NotificationResult(sent_channels=sent, failed_channels=failed, message=message, skipped=False)
 
-    def _build_new_receipts_message(self, target_dir: Path, new_images: list[Path]) -> str:
-        sorted_names = sorted(path.name for path in new_images)
-        details = [self._load_receipt_detail(target_dir, path) for path in sorted(new_images, key=lambda p: p.name)]
+    def _build_new_receipts_message(self, results: dict[str, dict[str, Any]], new_images: list[Path]) -> str:
+        details = [self._receipt_detail(results, path) for path in sorted(new_images, key=lambda p: p.name)]
         preview = details[: self.max_items]
         remainder = max(0, len(details) - len(preview))
-        total_amount = self._sum_current_total_amount(target_dir)
+        total_amount = self._sum_current_total_amount(results)
 
         lines = [
             "[MedStackOCR] 新しい領収書を検知しました",
             f"現時点での医療費合計: {total_amount}",
-            f"件数: {len(sorted_names)}",
+            f"件数: {len(new_images)}",
         ]
         for item in preview:
             lines.append(
@@ -70,18 +87,9 @@ class NotificationService:
             lines.append(f"- ... 他 {remainder} 件")
         return "\n".join(lines)
 
-    def _load_receipt_detail(self, target_dir: Path, image_path: Path) -> dict[str, str]:
-        result_path = target_dir / f"{image_path.stem}.result.json"
-        if not result_path.exists():
-            return {
-                "date": "",
-                "patient_name": "",
-                "clinic_or_pharmacy_name": image_path.name,
-                "amount": "",
-            }
-        try:
-            payload = load_json(result_path)
-        except Exception:
+    def _receipt_detail(self, results: dict[str, dict[str, Any]], image_path: Path) -> dict[str, str]:
+        payload = results.get(f"{image_path.stem}.result.json")
+        if payload is None:
             return {
                 "date": "",
                 "patient_name": "",
@@ -106,22 +114,14 @@ class NotificationService:
             "amount": amount,
         }
 
-    def _sum_current_total_amount(self, target_dir: Path) -> int:
-        total = 0
-        for result_path in sorted(target_dir.glob("*.result.json")):
-            try:
-                payload = load_json(result_path)
-            except Exception:
-                continue
-            fields = payload.get("fields", {})
-            if not isinstance(fields, dict):
-                continue
-            amount_candidate = fields.get(FieldName.PAYMENT_AMOUNT)
-            amount = self._to_int_amount(amount_candidate)
-            if amount is None:
-                continue
-            total += amount
-        return total
+    def _sum_current_total_amount(self, results: dict[str, dict[str, Any]]) -> int:
+        field_maps = (payload.get("fields", {}) for payload in results.values())
+        amounts = (
+            self._to_int_amount(fields.get(FieldName.PAYMENT_AMOUNT))
+            for fields in field_maps
+            if isinstance(fields, dict)
+        )
+        return sum(amount for amount in amounts if amount is not None)
 
     @staticmethod
     def _field_text(fields: dict[str, Any], field_name: str) -> str:
@@ -153,7 +153,7 @@ class NotificationService:
             text = str(value).strip()
             if not text:
                 continue
-            digits = re.sub(r"[^\d\-]", "", text)
+            digits = RE_NON_AMOUNT_CHARS.sub("", text)
             if not digits or digits in {"-", "--"}:
                 continue
             try:
@@ -272,7 +272,7 @@ class DeepSeekOCRAdapter:
 
     @staticmethod
     def _markdown_to_lines(text: str) -> list[dict[str, Any]]:
-        rows = [line.strip() for line in str(text).splitlines() if line.strip()]
+        rows = [row for line in str(text).splitlines() if (row := line.strip())]
         if not rows:
             return []
 
@@ -9,23 +9,23 @@ from ocr.paddle_adapter import PaddleOCRAdapter
 from ocr.tesseract_adapter import TesseractAdapter
 from ocr.yomitoku_adapter import YomitokuOCRAdapter
 
+ENGINE_ALIASES = {"deepseek-ocr": "deepseek", "deepseek_ocr": "deepseek"}
 
-def _canonical_engine_name(name: str) -> str:
+
+def canonical_engine_name(name: str) -> str:
     lowered = name.strip().lower()
-    if lowered in {"deepseek-ocr", "deepseek_ocr"}:
-        return "deepseek"
-    return lowered
+    return ENGINE_ALIASES.get(lowered, lowered)
 
 
 def _resolve_allowed_engines(config: dict[str, Any]) -> set[str]:
     ocr_conf = config.get("ocr", {})
     allowed = ocr_conf.get("allowed_engines")
     if isinstance(allowed, list):
-        resolved = {_canonical_engine_name(str(item)) for item in allowed if str(item).strip()}
+        resolved = {canonical_engine_name(str(item)) for item in allowed if str(item).strip()}
         if resolved:
             return resolved
 
-    configured = _canonical_engine_name(str(ocr_conf.get("engine", "yomitoku")))
+    configured = canonical_engine_name(str(ocr_conf.get("engine", "yomitoku")))
     return {configured}
 
 
@@ -38,7 +38,7 @@ def _assert_engine_available(name: str, ocr_config: dict[str, Any]) -> None:
 def create_ocr_adapter(engine_name: str, config: dict[str, Any]) -> OCRAdapter:
     configured = str(config.get("ocr", {}).get("engine", "yomitoku"))
     requested = engine_name or configured
-    name = _canonical_engine_name(requested)
+    name = canonical_engine_name(requested)
     ocr_config = config.get("ocr", {}).get("engines", {})
     allowed_engines = _resolve_allowed_engines(config)
 
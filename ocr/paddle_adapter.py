@@ -6,6 +6,8 @@ from typing import Any
 from core.models import OCRRawResult
 from ocr.base import OCRAdapterError
 
+LANG_ALIASES = {"ja": "japan", "jpn": "japan", "jp": "japan"}
+
 
 def _polygon_to_bbox(polygon: list[list[float]] | list[tuple[float, float]]) -> list[float]:
     xs = [float(p[0]) for p in polygon]
@@ -66,9 +68,7 @@ class PaddleOCRAdapter:
 
     @staticmethod
     def _map_lang(lang: str) -> str:
-        if lang in {"ja", "jpn", "jp", "japan"}:
-            return "japan"
-        return lang
+        return LANG_ALIASES.get(lang, lang)
 
     def healthcheck(self) -> bool:
         return self._paddleocr_module is not None
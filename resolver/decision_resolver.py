@@ -76,7 +76,7 @@ class DecisionResolver:
         for field_name, candidates in pool.items():
             if not candidates:
                 continue
-            best = sorted(candidates, key=lambda c: (c.score, c.ocr_confidence), reverse=True)[0]
+            best = max(candidates, key=lambda c: (c.score, c.ocr_confidence))
             threshold = self.candidate_threshold
             if best.source == "template":
                 threshold -= 0.7
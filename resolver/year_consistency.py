@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
 from core.enums import DecisionStatus, FieldName
@@ -40,8 +40,10 @@ def _apply_with_dominant_year(results: list[ExtractionResult], policy: dict[str,
 
     year_weights: dict[int, float] = defaultdict(float)
     valid_count = 0
+    years: list[int | None] = []
     for result in results:
         year, weight = _extract_payment_year_and_weight(result, weight_by_confidence=weight_by_confidence)
+        years.append(year)
         if year is None:
             continue
         valid_count += 1
@@ -58,8 +60,7 @@ def _apply_with_dominant_year(results: list[ExtractionResult], policy: dict[str,
     if dominant_ratio < ratio_threshold:
         return
 
-    for result in results:
-        year, _ = _extract_payment_year_and_weight(result, weight_by_confidence=weight_by_confidence)
+    for result, year in zip(results, years):
         if year is None or year == dominant_year:
             continue
         reason = (
@@ -83,7 +84,10 @@ def _extract_payment_year_and_weight(
         return None, 0.0
     text = str(value).strip()
     try:
-        parsed = datetime.strptime(text, "%Y-%m-%d")
+        if len(text) == 10 and text[4] == "-" and text[7] == "-" and text.isascii():
+            parsed = date.fromisoformat(text)
+        else:
+            parsed = datetime.strptime(text, "%Y-%m-%d")
     except ValueError:
         return None, 0.0
 
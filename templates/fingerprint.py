@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import math
-import re
 from typing import Any
 
 from core.models import BBox, OCRLine
 
+ANCHOR_NOISE_DELETE_TABLE = str.maketrans("", "", "0123456789０１２３４５６７８９,，./／:：¥￥-ー")
+
 
 def bbox_center(bbox: BBox) -> tuple[float, float]:
     return ((bbox[0] + bbox[2]) / 2.0, (bbox[1] + bbox[3]) / 2.0)
@@ -18,13 +19,11 @@ def bbox_distance(b1: BBox, b2: BBox) -> float:
 
 
 def sanitize_anchor_text(text: str, max_length: int = 12) -> str:
-    compact = re.sub(r"\s+", "", text).strip(" :：-")
-    compact = re.sub(r"[0-9０-９,，./／:：¥￥\-ー]+", "", compact)
-    compact = compact.strip(" :：-")
+    collapsed = "".join(text.split())
+    compact = collapsed.translate(ANCHOR_NOISE_DELETE_TABLE).strip(" :：-")
     if len(compact) >= 2:
         return compact[:max_length]
-    fallback = re.sub(r"\s+", "", text).strip(" :：-")
-    return fallback[:max_length]
+    return collapsed.strip(" :：-")[:max_length]
 
 
 def find_nearest_line(lines: list[OCRLine], target_bbox: BBox, max_distance: float = 0.2) -> OCRLine | None:
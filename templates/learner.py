@@ -30,6 +30,7 @@ class TemplateLearner:
             raise ValueError("household_id is required in review_fix or document_result")
 
         document_type = str(document_result.get("document_type", "unknown"))
+        now = datetime.now(timezone.utc)
         current_family_id = (
             document_result.get("template_match", {}).get("template_family_id")
             if isinstance(document_result.get("template_match"), dict)
@@ -38,7 +39,7 @@ class TemplateLearner:
         template_family_id = (
             str(current_family_id)
             if current_family_id
-            else f"{document_type}_family_{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"
+            else f"{document_type}_family_{now.strftime('%Y%m%d%H%M%S')}"
         )
 
         lines = self._parse_lines(document_result.get("ocr_lines", []))
@@ -62,7 +63,7 @@ class TemplateLearner:
             "field_specs": field_specs,
             "sample_count": sample_count,
             "success_rate": round(success_rate, 4),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "updated_at": now.isoformat(),
         }
 
         path = self.store.save_template(template)
@@ -1,20 +1,23 @@
 from __future__ import annotations
 
 import re
+from datetime import date
+from functools import lru_cache
 from typing import Any
 
 from core.models import Candidate, OCRLine, TemplateMatch
 from extractors.date_extractor import DateExtractor
-from extractors.common import is_near_line
+from extractors.common import is_near_line, normalize_spaces
 from templates.fingerprint import bbox_distance, line_in_bbox
 from templates.store import TemplateStore
 
+RE_AMOUNT = re.compile(r"(?:[¥￥]\s*)?(\d{1,3}(?:,\d{3})+|\d+)\s*(?:円)?")
+
 
 class TemplateMatcher:
     def __init__(self, store: TemplateStore, match_threshold: float = 0.65) -> None:
         self.store = store
         self.match_threshold = match_threshold
-        self._date_extractor = DateExtractor()
 
     def match(
         self,
@@ -100,14 +103,14 @@ class TemplateMatcher:
         if not isinstance(field_specs, dict):
             return {}
 
+        today = date.today()
         anchors = template.get("anchors", [])
-        anchor_lines = {
-            str(anchor.get("text_pattern", "")): [
-                line for line in lines if str(anchor.get("text_pattern", "")) in line.text
-            ]
-            for anchor in anchors
-            if str(anchor.get("text_pattern", "")).strip()
-        }
+        anchor_lines: dict[str, list[OCRLine]] = {}
+        for anchor in anchors:
+            pattern = str(anchor.get("text_pattern", ""))
+            if not pattern.strip():
+                continue
+            anchor_lines[pattern] = [line for line in lines if pattern in line.text]
         candidates: dict[str, list[Candidate]] = {}
 
         for field_name, spec_raw in field_specs.items():
@@ -135,9 +138,10 @@ class TemplateMatcher:
                         rule=rule,
                         line=line,
                         anchors=anchor_lines,
+                        today=today,
                     )
 
-                value_normalized = self._normalize_field_value(field_name, line.text)
+                value_normalized = self._normalize_field_value(field_name, line.text, today)
                 if value_normalized is None:
                     continue
 
@@ -156,7 +160,8 @@ class TemplateMatcher:
                 )
 
             if field_candidates:
-                candidates[field_name] = sorted(field_candidates, key=lambda c: c.score, reverse=True)[:3]
+                field_candidates.sort(key=lambda c: c.score, reverse=True)
+                candidates[field_name] = field_candidates[:3]
         return candidates
 
     def _apply_rule(
@@ -166,6 +171,7 @@ class TemplateMatcher:
         rule: str,
         line: OCRLine,
         anchors: dict[str, list[OCRLine]],
+        today: date,
     ) -> tuple[float, list[str]]:
         if rule == "topmost_text":
             score += max(0.0, 1.0 - line.center()[1])
@@ -198,7 +204,7 @@ class TemplateMatcher:
             return score, reasons
 
         if rule == "parse_date":
-            parsed = self._date_extractor._parse_date(line.text)  # noqa: SLF001
+            parsed = self._parse_date(line.text, today)
             if parsed is not None and not parsed[2]:
                 score += 0.8
                 reasons.append("rule:parse_date_ok")
@@ -220,26 +226,33 @@ class TemplateMatcher:
         return score, reasons
 
     @staticmethod
-    def _split_keywords(rule: str) -> list[str]:
+    @lru_cache(maxsize=128)
+    def _split_keywords(rule: str) -> tuple[str, ...]:
         _, value = rule.split(":", 1)
-        return [item.strip() for item in value.split(",") if item.strip()]
+        return tuple(item.strip() for item in value.split(",") if item.strip())
 
-    def _normalize_field_value(self, field_name: str, text: str) -> Any | None:
+    def _normalize_field_value(self, field_name: str, text: str, today: date) -> Any | None:
         if field_name == "payment_amount":
             return self._normalize_amount(text)
 
         if field_name == "payment_date":
-            parsed = self._date_extractor._parse_date(text)  # noqa: SLF001
+            parsed = self._parse_date(text, today)
             if parsed is None:
                 return None
             return parsed[0]
 
-        cleaned = re.sub(r"\s+", " ", text).strip()
+        cleaned = normalize_spaces(text)
         return cleaned or None
 
     @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_date(text: str, today: date) -> tuple[str, date | None, bool] | None:
+        return DateExtractor._parse_date(text, today=today)  # noqa: SLF001
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
     def _normalize_amount(text: str) -> int | None:
-        match = re.search(r"(?:[¥￥]\s*)?(\d{1,3}(?:,\d{3})+|\d+)\s*(?:円)?", text)
+        match = RE_AMOUNT.search(text)
         if not match:
             return None
         normalized = match.group(1).replace(",", "")
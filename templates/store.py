@@ -9,17 +9,16 @@ class TemplateStore:
     def __init__(self, root_path: str) -> None:
         self.root = Path(root_path)
         self.root.mkdir(parents=True, exist_ok=True)
+        self._cache: dict[Path, tuple[tuple[int, int], str]] = {}
 
     def load_household_templates(
         self, household_id: str, document_type: str | None = None
     ) -> list[dict[str, Any]]:
         folder = self.root / household_id
-        if not folder.exists():
-            return []
         templates: list[dict[str, Any]] = []
         for file in folder.glob("*.json"):
             try:
-                data = json.loads(file.read_text(encoding="utf-8"))
+                data = self._read_json(file)
             except Exception:
                 continue
             if not isinstance(data, dict):
@@ -31,10 +30,8 @@ class TemplateStore:
 
     def get_template(self, household_id: str, template_family_id: str) -> dict[str, Any] | None:
         path = self.root / household_id / f"{template_family_id}.json"
-        if not path.exists():
-            return None
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = self._read_json(path)
         except Exception:
             return None
         return data if isinstance(data, dict) else None
@@ -46,5 +43,16 @@ class TemplateStore:
         folder.mkdir(parents=True, exist_ok=True)
         path = folder / f"{family_id}.json"
         path.write_text(json.dumps(template, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._cache.pop(path, None)
         return path
 
+    def _read_json(self, path: Path) -> Any:
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == signature:
+            text = cached[1]
+        else:
+            text = path.read_text(encoding="utf-8")
+            self._cache[path] = (signature, text)
+        return json.loads(text)
@@ -8,6 +8,8 @@ from pathlib import Path
 from io_utils.batch_progress import (
     is_already_processed,
     load_processed_registry,
+    load_result_payloads,
+    read_processed_registry,
     save_processed_registry,
     update_processed_registry,
     write_summary_csv,
@@ -36,6 +38,22 @@ class BatchProgressTest(unittest.TestCase):
             image_path.write_bytes(b"abcd")
             self.assertFalse(is_already_processed(reloaded, image_path))
 
+    def test_read_processed_registry_reports_whether_file_is_current(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            registry_path = Path(tmp_dir) / "processed_files.json"
+            self.assertEqual(read_processed_registry(registry_path), ({}, False))
+
+            write_json(
+                registry_path,
+                {"items": {"a.jpg": {"size": 1, "mtime_ns": 2}, "broken.jpg": {"size": "x"}}},
+            )
+            registry, is_current = read_processed_registry(registry_path)
+            self.assertEqual(registry, {"a.jpg": {"size": 1, "mtime_ns": 2}})
+            self.assertFalse(is_current)
+
+            save_processed_registry(registry_path, registry)
+            self.assertEqual(read_processed_registry(registry_path), (registry, True))
+
     def test_write_summary_csv(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             base = Path(tmp_dir)
@@ -75,6 +93,19 @@ class BatchProgressTest(unittest.TestCase):
             self.assertEqual(rows[1], ["2026-01-27", "山田 太郎", "サンプルクリニック 本院", "2640"])
             self.assertEqual(rows[2], ["2026-01-27", "山田 花子", "サンプル薬局", "1800"])
 
+    def test_load_result_payloads_reuses_known_payloads(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            base = Path(tmp_dir)
+            write_json(base / "b.result.json", {"fields": {"payment_amount": {"value_normalized": 200}}})
+            write_json(base / "a.result.json", {"fields": {"payment_amount": {"value_normalized": 100}}})
+            known = {"b.result.json": {"fields": {"payment_amount": {"value_normalized": 999}}}}
+
+            payloads = load_result_payloads(base, known=known)
+
+            self.assertEqual(list(payloads), ["a.result.json", "b.result.json"])
+            self.assertEqual(payloads["a.result.json"]["fields"]["payment_amount"]["value_normalized"], 100)
+            self.assertIs(payloads["b.result.json"], known["b.result.json"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -100,6 +100,27 @@ class DateExtractorTest(unittest.TestCase):
                 self.assertTrue(candidates)
                 self.assertEqual(candidates[0].value_normalized, "2026-01-23")
 
+    def test_month_day_without_year_rejects_impossible_day(self) -> None:
+        extractor = DateExtractor()
+        samples = {"調剤日 2/29": "02-29", "調剤日 2/30": None, "調剤日 4/31": None}
+        for idx, (text, expected) in enumerate(samples.items()):
+            with self.subTest(text=text):
+                lines = [
+                    OCRLine(
+                        text=text,
+                        bbox=(0.5, 0.2, 0.9, 0.25),
+                        polygon=None,
+                        confidence=0.95,
+                        line_index=idx,
+                        page=1,
+                    )
+                ]
+                candidates = extractor.extract(lines)
+                if expected is None:
+                    self.assertEqual(candidates, [])
+                else:
+                    self.assertEqual(candidates[0].value_normalized, expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -39,6 +39,15 @@ class NotificationServiceTest(unittest.TestCase):
         self.assertTrue(result.skipped)
         self.assertEqual(notifier.messages, [])
 
+    def test_channels_not_built_when_disabled(self) -> None:
+        def _build(_: dict[str, Any]) -> tuple[dict[str, _DummyNotifier], dict[str, str]]:
+            raise AssertionError("channel builder must not run when notifications are disabled")
+
+        service = NotificationService({"notifications": {"enabled": False}}, channel_builder=_build)
+        with tempfile.TemporaryDirectory() as tmp:
+            result = service.notify_new_receipts(Path(tmp), [Path(tmp) / "a.jpg"])
+        self.assertTrue(result.skipped)
+
     def test_notify_new_receipts_with_limit_and_error_collection(self) -> None:
         slack = _DummyNotifier()
         discord = _DummyNotifier(should_fail=True)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from copy import deepcopy
+from unittest import mock
+
+from app.config import DEFAULT_CONFIG
+from app.pipeline import ReceiptExtractionPipeline
+
+
+class PipelineOCRAdapterTest(unittest.TestCase):
+    def test_reuses_ocr_adapter_per_canonical_engine(self) -> None:
+        config = deepcopy(DEFAULT_CONFIG)
+        config["ocr"]["engine"] = "mock"
+        config["ocr"]["allowed_engines"] = ["mock"]
+        config["ocr"]["engines"]["mock"]["enabled"] = True
+        with tempfile.TemporaryDirectory() as tmp:
+            config["templates"]["store_path"] = tmp
+            pipeline = ReceiptExtractionPipeline(config)
+            first = pipeline._get_ocr_adapter("mock")  # noqa: SLF001
+            for engine in ("mock", " Mock ", "MOCK", ""):
+                with self.subTest(engine=engine):
+                    self.assertIs(pipeline._get_ocr_adapter(engine), first)  # noqa: SLF001
+
+    def test_replaces_ocr_adapter_when_engine_changes(self) -> None:
+        config = deepcopy(DEFAULT_CONFIG)
+        with tempfile.TemporaryDirectory() as tmp:
+            config["templates"]["store_path"] = tmp
+            pipeline = ReceiptExtractionPipeline(config)
+            with mock.patch("app.pipeline.create_ocr_adapter", side_effect=lambda name, _: object()) as factory:
+                deepseek = pipeline._get_ocr_adapter("deepseek")  # noqa: SLF001
+                self.assertIs(pipeline._get_ocr_adapter("DeepSeek-OCR"), deepseek)  # noqa: SLF001
+                yomitoku = pipeline._get_ocr_adapter("yomitoku")  # noqa: SLF001
+                self.assertIsNot(yomitoku, deepseek)
+                self.assertIsNot(pipeline._get_ocr_adapter("deepseek"), deepseek)  # noqa: SLF001
+            self.assertEqual(
+                [call.args[0] for call in factory.call_args_list],
+                ["deepseek", "yomitoku", "deepseek"],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
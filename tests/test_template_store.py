@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+
+from templates.store import TemplateStore
+
+
+class TemplateStoreTest(unittest.TestCase):
+    def test_reloads_template_after_save_and_external_edit(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = TemplateStore(tmp)
+            template = {
+                "template_family_id": "pharmacy_family_001",
+                "household_id": "household_demo",
+                "document_type": "pharmacy",
+                "sample_count": 1,
+            }
+            path = store.save_template(template)
+            self.assertEqual(store.get_template("household_demo", "pharmacy_family_001")["sample_count"], 1)
+
+            store.save_template({**template, "sample_count": 2})
+            self.assertEqual(store.get_template("household_demo", "pharmacy_family_001")["sample_count"], 2)
+
+            stat = path.stat()
+            path.write_text(json.dumps({**template, "sample_count": 3}), encoding="utf-8")
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            templates = store.load_household_templates("household_demo", document_type="pharmacy")
+            self.assertEqual([t["sample_count"] for t in templates], [3])
+
+    def test_missing_template_returns_none(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = TemplateStore(tmp)
+            self.assertIsNone(store.get_template("household_demo", "missing"))
+            self.assertEqual(store.load_household_templates("household_demo"), [])
+
+    def test_returned_templates_are_independent_copies(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = TemplateStore(tmp)
+            store.save_template(
+                {
+                    "template_family_id": "pharmacy_family_001",
+                    "household_id": "household_demo",
+                    "document_type": "pharmacy",
+                    "anchors": [{"text_pattern": "領収書", "bbox": [0.4, 0.02, 0.62, 0.07]}],
+                }
+            )
+            loaded = store.get_template("household_demo", "pharmacy_family_001")
+            loaded["anchors"].clear()
+            loaded["sample_count"] = 99
+
+            reloaded = store.get_template("household_demo", "pharmacy_family_001")
+            self.assertEqual(len(reloaded["anchors"]), 1)
+            self.assertNotIn("sample_count", reloaded)
+            self.assertEqual(len(store.load_household_templates("household_demo")[0]["anchors"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()